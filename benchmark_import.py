@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+匯入時間基準測試
+在全新的 Python 程序中量測匯入與首次使用的耗時，並確認匯入 excelcheck
+不會連帶載入 pandas / xlrd / openpyxl
+
+用法:
+    python benchmark_import.py [重複次數] [正確的 .xls 檔案 待檢查的 .xls 檔案]
+
+提供兩個 .xls 檔案時，會額外量測 ExcelFormatChecker 首次 check_all() 的耗時
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Tuple
+
+
+# 子程序一律在本腳本所在目錄執行，確保能匯入 excelcheck
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+BACKENDS = ('pandas', 'xlrd', 'openpyxl', 'streamlit')
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """在本專案目錄下以新的 Python 程序執行程式碼"""
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=ROOT)
+
+
+def _error_message(proc: subprocess.CompletedProcess) -> str:
+    """取出子程序錯誤訊息的最後一行"""
+    lines = proc.stderr.strip().splitlines()
+    return lines[-1] if lines else f"結束代碼 {proc.returncode}"
+
+
+def time_import(statement: str, repeat: int) -> list:
+    """在新程序中執行語句，回傳每次的耗時（毫秒）"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = run_python(statement)
+        elapsed = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            raise RuntimeError(_error_message(proc))
+        timings.append(elapsed)
+    return timings
+
+
+def loaded_backends() -> list:
+    """回傳匯入 excelcheck 後已被載入的後端模組"""
+    code = (
+        'import sys, excelcheck; '
+        f'print(",".join(m for m in {BACKENDS!r} if m in sys.modules))'
+    )
+    proc = run_python(code)
+    if proc.returncode != 0:
+        raise RuntimeError(_error_message(proc))
+    return [m for m in proc.stdout.strip().split(',') if m]
+
+
+def create_sum_sample(directory: str) -> str:
+    """建立求和驗證用的 .xlsx 範例檔，無 openpyxl 時回傳空字串"""
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        return ''
+
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, 11):
+        ws[f"A{row}"] = row
+    ws["B1"] = sum(range(1, 11))
+
+    path = os.path.join(directory, 'sum_sample.xlsx')
+    wb.save(path)
+    return path
+
+
+def build_targets(sum_sample: str, format_files: list) -> Tuple[dict, dict]:
+    """建立量測項目，回傳（名稱 -> 在新程序中執行的語句, 名稱 -> 略過原因）"""
+    targets = {
+        'python 空程序': 'pass',
+        'import excelcheck（worker / 腳本啟動成本）': 'import excelcheck',
+        '舊版 app.py 等效匯入（streamlit + pandas + xlrd + openpyxl）':
+            'import streamlit, pandas, xlrd, openpyxl',
+        '舊版後端匯入（僅 pandas + xlrd + openpyxl，不含 streamlit）':
+            'import pandas, xlrd, openpyxl',
+    }
+    skipped = {}
+
+    if sum_sample:
+        targets['SumVerifier 首次驗證 .xlsx（含延遲載入 openpyxl）'] = (
+            'import excelcheck; '
+            f'r = excelcheck.SumVerifier({sum_sample!r}).verify_sum("A1:A10", "B1"); '
+            'assert r["error"] is None, r["error"]'
+        )
+    else:
+        skipped['SumVerifier 首次驗證 .xlsx（含延遲載入 openpyxl）'] = '未安裝 openpyxl，無法建立範例檔'
+
+    if format_files:
+        correct, test = format_files
+        targets['ExcelFormatChecker 首次 check_all()（含延遲載入 pandas + xlrd）'] = (
+            'import excelcheck; '
+            f'r = excelcheck.ExcelFormatChecker({correct!r}, {test!r}).check_all(); '
+            'assert "讀取檔案失敗" not in str(r["columns"]["issues"]), r["columns"]["issues"]'
+        )
+    else:
+        skipped['ExcelFormatChecker 首次 check_all()（含延遲載入 pandas + xlrd）'] = '未提供兩個 .xls 檔案'
+
+    return targets, skipped
+
+
+def main():
+    """主程式"""
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    format_files = [os.path.abspath(p) for p in sys.argv[2:4]]
+    if len(format_files) != 2:
+        format_files = []
+
+    print(f"匯入時間基準測試（每項 {repeat} 次，取中位數）")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        targets, skipped = build_targets(create_sum_sample(tmp_dir), format_files)
+
+        for name, statement in targets.items():
+            try:
+                timings = time_import(statement, repeat)
+            except RuntimeError as e:
+                print(f"⚠️  {name}: 無法執行 ({e})")
+                continue
+            print(f"{name}: {statistics.median(timings):.1f} ms (最小 {min(timings):.1f} ms)")
+
+        for name, reason in skipped.items():
+            print(f"-  {name}: 略過（{reason}）")
+
+    print("=" * 60)
+
+    try:
+        backends = loaded_backends()
+    except RuntimeError as e:
+        print(f"❌ 無法匯入 excelcheck: {e}")
+        sys.exit(1)
+
+    if backends:
+        print(f"❌ 匯入 excelcheck 時載入了後端模組: {', '.join(backends)}")
+        sys.exit(1)
+    print("✓ 匯入 excelcheck 未載入任何 Excel 後端或 Streamlit")
+
+
+if __name__ == "__main__":
+    main()
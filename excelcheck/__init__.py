@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Excel 格式比對核心套件
+不依賴 Streamlit，可直接在腳本或 worker 中使用：
+
+    from excelcheck import ExcelFormatChecker, SumVerifier
+
+pandas / xlrd / openpyxl 皆延遲到實際讀取檔案時才載入
+"""
+
+from .checker import CHECK_NAMES, ExcelFormatChecker
+from .report import REPORT_FORMATS, export_report, iter_findings, summarize
+from .sum_verifier import SumVerifier
+
+__all__ = [
+    'CHECK_NAMES',
+    'ExcelFormatChecker',
+    'REPORT_FORMATS',
+    'SumVerifier',
+    'export_report',
+    'iter_findings',
+    'summarize',
+]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+比對結果報告匯出
+將 ExcelFormatChecker.check_all() 的結果逐列序列化為 Excel / CSV / JSON，
+寫出時不會在記憶體中另外組出一份完整的報告副本
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Any, Iterator, BinaryIO, Optional
+
+from .checker import CHECK_NAMES
+
+
+REPORT_COLUMNS = ['check', 'check_name', 'passed', 'severity', 'issue']
+
+# 格式 -> (副檔名, MIME 類型)
+REPORT_FORMATS = {
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('csv', 'text/csv'),
+    'json': ('json', 'application/json'),
+}
+
+
+def _severity(issue: str) -> str:
+    """依問題前綴判斷嚴重程度"""
+    if issue.startswith('❌'):
+        return 'error'
+    if issue.startswith('⚠️'):
+        return 'warning'
+    return 'info'
+
+
+def iter_findings(results: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    逐筆產生報告列
+    通過的檢查產生一列空白問題，失敗的檢查每個問題各一列
+
+    Args:
+        results: ExcelFormatChecker.check_all() 的結果
+
+    Yields:
+        報告列字典，欄位見 REPORT_COLUMNS
+    """
+    for check_key, result in results.items():
+        check_name = CHECK_NAMES.get(check_key, check_key)
+
+        if result['passed']:
+            yield {
+                'check': check_key,
+                'check_name': check_name,
+                'passed': True,
+                'severity': '',
+                'issue': ''
+            }
+            continue
+
+        for issue in result['issues']:
+            yield {
+                'check': check_key,
+                'check_name': check_name,
+                'passed': False,
+                'severity': _severity(issue),
+                'issue': issue
+            }
+
+
+def summarize(results: Dict[str, Any]) -> Dict[str, int]:
+    """統計通過/失敗的檢查數與問題總數"""
+    total_checks = len(results)
+    passed_checks = sum(1 for r in results.values() if r['passed'])
+    total_issues = sum(len(r['issues']) for r in results.values() if not r['passed'])
+
+    return {
+        'total_checks': total_checks,
+        'passed_checks': passed_checks,
+        'failed_checks': total_checks - passed_checks,
+        'total_issues': total_issues
+    }
+
+
+def write_csv(results: Dict[str, Any], fp: BinaryIO) -> None:
+    """以 CSV 逐列寫出報告（UTF-8 BOM，方便 Excel 直接開啟）"""
+    text_fp = io.TextIOWrapper(fp, encoding='utf-8-sig', newline='')
+    try:
+        writer = csv.DictWriter(text_fp, fieldnames=REPORT_COLUMNS)
+        writer.writeheader()
+        for row in iter_findings(results):
+            writer.writerow(row)
+        text_fp.flush()
+    finally:
+        # 分離包裝層，避免關閉呼叫端的 fp
+        text_fp.detach()
+
+
+def write_json(results: Dict[str, Any], fp: BinaryIO) -> None:
+    """以 JSON 逐筆寫出報告，不會先在記憶體組出完整的 findings 陣列"""
+    summary = json.dumps(summarize(results), ensure_ascii=False)
+    fp.write(f'{{"summary": {summary}, "findings": ['.encode('utf-8'))
+
+    for i, row in enumerate(iter_findings(results)):
+        prefix = '\n  ' if i == 0 else ',\n  '
+        fp.write((prefix + json.dumps(row, ensure_ascii=False)).encode('utf-8'))
+
+    fp.write(b'\n]}\n')
+
+
+def write_xlsx(results: Dict[str, Any], fp: BinaryIO) -> None:
+    """以 openpyxl write-only 模式逐列寫出報告"""
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    wb = Workbook(write_only=True)
+
+    ws_summary = wb.create_sheet('summary')
+    for key, value in summarize(results).items():
+        ws_summary.append([key, value])
+
+    ws = wb.create_sheet('findings')
+    ws.append(REPORT_COLUMNS)
+    for row in iter_findings(results):
+        # 欄位名稱可能含有 Excel 不接受的控制字元
+        ws.append([
+            ILLEGAL_CHARACTERS_RE.sub('', v) if isinstance(v, str) else v
+            for v in (row[col] for col in REPORT_COLUMNS)
+        ])
+
+    wb.save(fp)
+
+
+_WRITERS = {
+    'xlsx': write_xlsx,
+    'csv': write_csv,
+    'json': write_json,
+}
+
+
+def export_report(results: Dict[str, Any], fmt: str, fp: Optional[BinaryIO] = None) -> Optional[bytes]:
+    """
+    匯出比對報告
+
+    Args:
+        results: ExcelFormatChecker.check_all() 的結果
+        fmt: 報告格式 ('xlsx', 'csv', 'json')
+        fp: 可寫入的二進位檔案物件；未提供時寫入記憶體並回傳內容
+
+    Returns:
+        未提供 fp 時回傳報告內容，否則回傳 None
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"不支持的報告格式: {fmt}")
+
+    if fp is not None:
+        _WRITERS[fmt](results, fp)
+        return None
+
+    buffer = io.BytesIO()
+    _WRITERS[fmt](results, buffer)
+    return buffer.getvalue()
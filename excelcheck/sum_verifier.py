@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+求和驗證器
+openpyxl 只在實際驗證時才載入，pandas 只在 openpyxl 讀取失敗時才載入
+"""
+
+import re
+from typing import Dict, Any
+
+
+class SumVerifier:
+    """求和驗證器"""
+
+    def __init__(self, excel_file):
+        self.excel_file = excel_file
+
+    def parse_cell_range(self, range_str: str) -> list:
+        """
+        解析儲存格範圍
+        例如: "A1:A10" -> [A1, A2, ..., A10]
+        """
+        range_str = range_str.upper().strip()
+
+        if ':' not in range_str:
+            # 單個儲存格
+            return [range_str]
+
+        start_cell, end_cell = range_str.split(':')
+
+        # 提取列和行
+        start_col = re.match(r'[A-Z]+', start_cell).group()
+        start_row = int(re.search(r'\d+', start_cell).group())
+
+        end_col = re.match(r'[A-Z]+', end_cell).group()
+        end_row = int(re.search(r'\d+', end_cell).group())
+
+        # 轉換列字母為數字
+        start_col_num = self._col_letter_to_num(start_col)
+        end_col_num = self._col_letter_to_num(end_col)
+
+        cells = []
+        for col in range(start_col_num, end_col_num + 1):
+            col_letter = self._col_num_to_letter(col)
+            for row in range(start_row, end_row + 1):
+                cells.append(f"{col_letter}{row}")
+
+        return cells
+
+    @staticmethod
+    def _col_letter_to_num(col_letter: str) -> int:
+        """將列字母轉換為數字 (A=1, B=2, ..., Z=26, AA=27)"""
+        result = 0
+        for char in col_letter:
+            result = result * 26 + (ord(char) - ord('A') + 1)
+        return result
+
+    @staticmethod
+    def _col_num_to_letter(col_num: int) -> str:
+        """將列數字轉換為字母 (1=A, 2=B, ..., 26=Z, 27=AA)"""
+        result = ""
+        while col_num > 0:
+            col_num -= 1
+            result = chr(col_num % 26 + ord('A')) + result
+            col_num //= 26
+        return result
+
+    def verify_sum(self, cell_range: str, target_cell: str, sheet_index: int = 0) -> Dict[str, Any]:
+        """
+        驗證儲存格範圍的求和是否等於目標儲存格
+
+        Args:
+            cell_range: 儲存格範圍 (如 "A1:A10")
+            target_cell: 目標儲存格 (如 "B1")
+            sheet_index: 工作表索引 (默認為 0)
+
+        Returns:
+            驗證結果字典
+        """
+        try:
+            # 嘗試用 openpyxl 讀取 (用於 .xlsx)
+            try:
+                from openpyxl import load_workbook
+
+                wb = load_workbook(self.excel_file)
+                ws = wb.worksheets[sheet_index]
+
+                # 提取儲存格範圍中的值
+                cells = self.parse_cell_range(cell_range)
+                values = []
+                for cell in cells:
+                    try:
+                        val = ws[cell].value
+                        if val is not None and isinstance(val, (int, float)):
+                            values.append(float(val))
+                    except:
+                        pass
+
+                # 獲取目標儲存格的值
+                target_val = ws[target_cell].value
+                if target_val is None:
+                    return {
+                        'passed': False,
+                        'error': f'目標儲存格 {target_cell} 為空',
+                        'values': [],
+                        'sum': 0,
+                        'target': None
+                    }
+
+                target_val = float(target_val)
+                sum_val = sum(values)
+
+                # 檢查是否相等（允許浮點誤差）
+                epsilon = 1e-9
+                passed = abs(sum_val - target_val) < epsilon
+
+                return {
+                    'passed': passed,
+                    'error': None,
+                    'values': values,
+                    'sum': sum_val,
+                    'target': target_val,
+                    'cell_range': cell_range,
+                    'target_cell': target_cell,
+                    'cells_count': len(values)
+                }
+
+            except Exception as e:
+                # 如果 openpyxl 失敗，嘗試用 pandas
+                try:
+                    import pandas as pd
+
+                    df = pd.read_excel(self.excel_file, sheet_name=sheet_index)
+                    # 這種方法較難精確定位儲存格，返回錯誤
+                    return {
+                        'passed': False,
+                        'error': '不支持此檔案格式，請使用 .xlsx 格式',
+                        'values': [],
+                        'sum': 0,
+                        'target': None
+                    }
+                except:
+                    return {
+                        'passed': False,
+                        'error': f'無法讀取檔案: {str(e)}',
+                        'values': [],
+                        'sum': 0,
+                        'target': None
+                    }
+
+        except Exception as e:
+            return {
+                'passed': False,
+                'error': f'驗證失敗: {str(e)}',
+                'values': [],
+                'sum': 0,
+                'target': None
+            }